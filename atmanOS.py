@@ -9,12 +9,19 @@ Implements fungal-inspired XIQA with high τₖ (temporal coherence)
 
 import sys
 import numpy as np
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 import time
 import math
 
+# Precision modes: (float dtype for node state, integer dtype for CSR node indices)
+PRECISION_MODES = {
+    "float64": (np.float64, np.intp),
+    "float32": (np.float32, np.int32),
+}
+
 
 @dataclass
 class TemporalCoherence:
@@ -50,81 +57,305 @@ class HarmonicNode:
         self.phase += coupling_strength * np.sin(phase_diff)
 
 
-class MycelialNetwork:
-    """Distributed temporal processor inspired by fungal networks"""
+class HarmonicNodeView:
+    """A HarmonicNode whose state lives in its network's arrays"""
+
+    __slots__ = ("network", "index")
+
+    def __init__(self, network: 'MycelialNetwork', index: int):
+        self.network = network
+        self.index = index
+
+    def _array_field(name: str) -> property:
+        """Property reading and writing one element of a network array"""
+        def fget(self):
+            return getattr(self.network, name)[self.index].item()
+
+        def fset(self, value):
+            getattr(self.network, name)[self.index] = value
+
+        return property(fget, fset)
+
+    tau_k_local = _array_field("tau_k_local")
+    resonance_frequency = _array_field("resonance_frequency")
+    phase = _array_field("phases")
+    bioelectric_potential = _array_field("potentials")
+    del _array_field
+
+    @property
+    def node_id(self) -> str:
+        return f"node_{self.index}"
+
+    @property
+    def position(self) -> np.ndarray:
+        return self.network.positions[self.index]
+
+    @property
+    def connections(self) -> List[str]:
+        """Fresh list of neighbor ids; editing it does not change the topology"""
+        start, stop = self.network._edge_offsets[self.index:self.index + 2]
+        return [f"node_{j}" for j in self.network._edge_targets[start:stop]]
+
+    oscillate = HarmonicNode.oscillate
+    entrain_with = HarmonicNode.entrain_with
+
+    def __repr__(self) -> str:
+        return f"HarmonicNodeView({self.node_id!r}, phase={self.phase:.4f})"
+
+
+class NodeMap(Mapping):
+    """Read-only ``node_id -> HarmonicNodeView`` mapping over a network"""
+
+    def __init__(self, network: 'MycelialNetwork'):
+        self.network = network
+
+    def __getitem__(self, node_id: str) -> HarmonicNodeView:
+        prefix, _, suffix = node_id.partition("_")
+        if prefix == "node" and suffix.isdigit() and f"node_{int(suffix)}" == node_id:
+            index = int(suffix)
+            if index < self.network.size:
+                return HarmonicNodeView(self.network, index)
+        raise KeyError(node_id)
+
+    def __iter__(self):
+        return (f"node_{i}" for i in range(self.network.size))
+
+    def __len__(self) -> int:
+        return self.network.size
 
-    def __init__(self, size: int = 100, dimension: int = 2):
-        self.nodes: Dict[str, HarmonicNode] = {}
+
+class PhaseHistoryBuffer:
+    """Circular buffer of recent node phases for delayed coupling
+
+    Holds one row per time step for the last ``max_delay + 1`` steps, so
+    memory is O(N × max_delay) regardless of how many edges read from it.
+    """
+
+    def __init__(self, initial_phases: np.ndarray, max_delay: int,
+                 dtype: type = np.float64):
+        self.depth = max_delay + 1
+        self.buffer = np.tile(initial_phases.astype(dtype), (self.depth, 1))
+        self.head = 0
+
+    def push(self, phases: np.ndarray):
+        """Record the current phases, overwriting the oldest row"""
+        self.head = (self.head + 1) % self.depth
+        self.buffer[self.head] = phases
+
+    def lookup(self, node_indices: np.ndarray, delays: np.ndarray) -> np.ndarray:
+        """Read each node's phase as it was ``delays`` steps ago"""
+        rows = (self.head - delays) % self.depth
+        return self.buffer[rows, node_indices]
+
+
+class MycelialNetwork:
+    """Distributed temporal processor inspired by fungal networks
+
+    Node state (positions, phases, potentials) is held in network-owned
+    arrays; ``nodes`` is a read-only mapping that exposes it as
+    ``HarmonicNodeView`` objects on access.
+
+    By default entrainment sweeps the nodes in order, each one phase-locking
+    to its neighbors' current phases in place. With ``conduction_velocity``
+    set (distance units per time step), signals arrive after a delay
+    proportional to distance and all nodes update synchronously from a
+    shared phase history buffer.
+
+    ``precision="float32"`` stores node state, the phase history and the
+    coherence history in single precision and CSR node indices as int32.
+    """
+
+    def __init__(self, size: int = 100, dimension: int = 2,
+                 conduction_velocity: Optional[float] = None,
+                 precision: str = "float64", history_capacity: int = 1024):
+        if precision not in PRECISION_MODES:
+            raise ValueError(f"precision must be one of {sorted(PRECISION_MODES)}")
+        if conduction_velocity is not None and not conduction_velocity > 0:
+            raise ValueError("conduction_velocity must be positive")
+
+        self.precision = precision
+        self.dtype, self.index_dtype = PRECISION_MODES[precision]
+        if size > np.iinfo(self.index_dtype).max:
+            raise ValueError(f"size {size} does not fit {precision} node indices")
+
+        self.size = size
+        self.nodes = NodeMap(self)
         self.dimension = dimension
         self.global_coherence = TemporalCoherence()
-        self.expansion_history: List[float] = []
         self.time_steps = 0
+        self.conduction_velocity = conduction_velocity
+        self.phase_history: Optional[PhaseHistoryBuffer] = None
+
+        # Preallocated coherence recorder, doubled when full
+        self._history_buffer = np.empty(history_capacity, dtype=self.dtype)
+        self._history_length = 0
 
         # Initialize network with golden ratio spacing
         self._initialize_harmonic_lattice(size)
+        if conduction_velocity is not None:
+            self._build_delay_lines()
+
+    @property
+    def expansion_history(self) -> np.ndarray:
+        """Snapshot copy of the coherence recorded at each step so far"""
+        return self._history_buffer[:self._history_length].copy()
 
     def _initialize_harmonic_lattice(self, size: int):
         """Create nodes with golden ratio / Fibonacci spacing"""
         phi = (1 + np.sqrt(5)) / 2  # Golden ratio
 
-        for i in range(size):
-            # Golden angle for spiral distribution
-            theta = 2 * np.pi * i / phi**2
-            r = np.sqrt(i) * phi
+        # Golden angle for spiral distribution
+        i = np.arange(size)
+        theta = 2 * np.pi * i / phi**2
+        r = np.sqrt(i) * phi
 
-            if self.dimension == 2:
-                pos = np.array([r * np.cos(theta), r * np.sin(theta)])
-            else:
-                pos = np.random.randn(self.dimension) * r
+        if self.dimension == 2:
+            positions = np.column_stack((r * np.cos(theta), r * np.sin(theta)))
+        else:
+            positions = np.random.randn(size, self.dimension) * r[:, None]
 
-            node = HarmonicNode(
-                node_id=f"node_{i}",
-                position=pos,
-                tau_k_local=self.global_coherence.tau_k + np.random.normal(0, 0.3),
-                phase=np.random.uniform(0, 2*np.pi)
-            )
-            self.nodes[node.node_id] = node
+        self.positions = positions.astype(self.dtype)
+        self.tau_k_local = (
+            self.global_coherence.tau_k + np.random.normal(0, 0.3, size)
+        ).astype(self.dtype)
+        self.resonance_frequency = np.full(size, HarmonicNode.resonance_frequency, dtype=self.dtype)
+        self.phases = np.random.uniform(0, 2*np.pi, size).astype(self.dtype)
+        self.potentials = np.zeros(size, dtype=self.dtype)
 
         # Connect nearby nodes (mycelial topology)
         self._establish_connections()
 
     def _establish_connections(self, connection_radius: float = 5.0):
-        """Create mycelial network topology"""
-        node_list = list(self.nodes.values())
-
-        for i, node1 in enumerate(node_list):
-            for node2 in node_list[i+1:]:
-                distance = np.linalg.norm(node1.position - node2.position)
-                if distance < connection_radius:
-                    node1.connections.append(node2.node_id)
-                    node2.connections.append(node1.node_id)
+        """Create mycelial network topology as CSR adjacency arrays
+
+        Positions are binned into cells of side ``connection_radius``, so each
+        node only needs to be compared against its own and adjacent cells.
+        """
+        # Cell coordinates, padded by one so every neighbor cell has a valid key
+        cells = np.floor(self.positions / connection_radius).astype(np.int64)
+        cells -= cells.min(axis=0, initial=0) - 1
+        shape = tuple(cells.max(axis=0, initial=0) + 2)
+        keys = np.ravel_multi_index(tuple(cells.T), shape)
+        strides = np.array([int(np.prod(shape[k + 1:])) for k in range(len(shape))])
+
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        node_ids = np.arange(self.size)
+
+        # Half of the neighbor offsets (plus the cell itself) covers each pair once
+        lower = [np.empty(0, dtype=self.index_dtype)]
+        upper = [np.empty(0, dtype=self.index_dtype)]
+        for offset in np.ndindex(*(3,) * self.dimension):
+            offset = np.array(offset) - 1
+            nonzero = offset[offset != 0]
+            if len(nonzero) and nonzero[0] < 0:
+                continue
+
+            lo = np.searchsorted(sorted_keys, keys + offset @ strides, side="left")
+            counts = np.searchsorted(sorted_keys, keys + offset @ strides, side="right") - lo
+            first = np.cumsum(counts) - counts
+            i = np.repeat(node_ids, counts)
+            j = order[np.repeat(lo - first, counts) + np.arange(counts.sum())]
+
+            keep = np.linalg.norm(self.positions[i] - self.positions[j], axis=1) < connection_radius
+            if not len(nonzero):
+                keep &= i < j
+            lower.append(i[keep].astype(self.index_dtype))
+            upper.append(j[keep].astype(self.index_dtype))
+
+        sources = np.concatenate(lower + upper)
+        targets = np.concatenate(upper + lower)
+        del lower, upper
+        edge_order = np.lexsort((targets, sources))
+        self._edge_sources = sources[edge_order]
+        self._edge_targets = targets[edge_order]
+
+        # Offsets stay int64 so edge counts beyond 2**31 cannot wrap
+        self._edge_offsets = np.zeros(self.size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self._edge_sources, minlength=self.size),
+                  out=self._edge_offsets[1:])
+
+    def _build_delay_lines(self):
+        """Quantize per-edge delays and allocate the phase history buffer"""
+        # Delay in whole time steps: distance / velocity, rounded
+        distances = np.linalg.norm(
+            self.positions[self._edge_sources] - self.positions[self._edge_targets], axis=1
+        )
+        self._edge_delays = np.rint(distances / self.conduction_velocity).astype(self.index_dtype)
+
+        # Rows with at least one edge; reduceat segments run between their starts
+        self._coupled_nodes = np.flatnonzero(np.diff(self._edge_offsets)).astype(self.index_dtype)
+        self._coupled_starts = self._edge_offsets[self._coupled_nodes]
+
+        max_delay = int(self._edge_delays.max()) if len(self._edge_delays) else 0
+        self.phase_history = PhaseHistoryBuffer(self.phases, max_delay, dtype=self.dtype)
+
+    def _entrain(self, coupling_strength: float):
+        """Instantaneous Kuramoto sweep, equivalent to ``entrain_with`` per edge
+
+        Nodes update in order and in place, so later nodes see the phases
+        earlier nodes already moved to this step.
+        """
+        phases = self.phases.tolist()
+        offsets = self._edge_offsets.tolist()
+        targets = self._edge_targets.tolist()
+
+        for i in range(self.size):
+            phase = phases[i]
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                phase += coupling_strength * math.sin(phases[j] - phase)
+            phases[i] = phase
+
+        self.phases[:] = phases
+
+    def _entrain_delayed(self, coupling_strength: float):
+        """Kuramoto entrainment against neighbors' delayed phases
+
+        All nodes update synchronously from the same snapshot.
+        """
+        self.phase_history.push(self.phases)
+
+        delayed = self.phase_history.lookup(self._edge_targets, self._edge_delays)
+        drive = coupling_strength * np.sin(delayed - self.phases[self._edge_sources])
+
+        # Per-node sums over CSR rows, accumulated in self.dtype
+        if len(drive):
+            self.phases[self._coupled_nodes] += np.add.reduceat(drive, self._coupled_starts)
+
+    def _record_coherence(self, coherence: float):
+        """Append to the recorder buffer, doubling its capacity when full"""
+        if self._history_length == len(self._history_buffer):
+            grown = np.empty(max(2 * len(self._history_buffer), 1), dtype=self.dtype)
+            grown[:self._history_length] = self._history_buffer
+            self._history_buffer = grown
+
+        self._history_buffer[self._history_length] = coherence
+        self._history_length += 1
 
     def harmonic_expansion_step(self, t: float):
         """Execute one step of harmonic expansion (growth)"""
         self.time_steps += 1
 
-        # Update each node's oscillation
-        for node in self.nodes.values():
-            node.bioelectric_potential = node.oscillate(t)
+        # Update each node's oscillation; 2πft is large, so keep it in float64
+        omega_t = np.multiply(self.resonance_frequency, 2 * np.pi * t, dtype=np.float64)
+        self.potentials[:] = np.cos(omega_t + self.phases)
 
         # Synchronize connected nodes (phase entrainment)
-        for node in self.nodes.values():
-            for connected_id in node.connections:
-                connected_node = self.nodes[connected_id]
-                node.entrain_with(connected_node, coupling_strength=0.05)
+        if self.phase_history is not None:
+            self._entrain_delayed(coupling_strength=0.05)
+        else:
+            self._entrain(coupling_strength=0.05)
 
         # Calculate network coherence
         coherence = self._measure_network_coherence()
-        self.expansion_history.append(coherence)
+        self._record_coherence(coherence)
 
         return coherence
 
     def _measure_network_coherence(self) -> float:
         """Calculate order parameter (Kuramoto synchronization)"""
-        phases = np.array([node.phase for node in self.nodes.values()])
-
         # Complex order parameter
-        r = np.abs(np.mean(np.exp(1j * phases)))
+        r = float(np.abs(np.mean(np.exp(1j * self.phases))))
 
         # Update global tau_k based on coherence
         self.global_coherence.tau_k = 7.5 + r * 1.5
@@ -132,6 +363,35 @@ class MycelialNetwork:
 
         return r
 
+    def memory_report(self) -> Dict[str, int]:
+        """Bytes held by each network component
+
+        Only array buffers are counted: ``nodes`` builds its views on access
+        and holds no per-node state of its own.
+        """
+        report = {
+            "positions": self.positions.nbytes,
+            "phases": self.phases.nbytes,
+            "potentials": self.potentials.nbytes,
+            "tau_k_local": self.tau_k_local.nbytes,
+            "resonance_frequency": self.resonance_frequency.nbytes,
+            "csr_edges": sum(
+                a.nbytes for a in (self._edge_offsets, self._edge_sources, self._edge_targets)
+            ),
+            "edge_delays": 0,
+            "coupled_rows": 0,
+            "phase_history": 0,
+            "expansion_history": self._history_buffer.nbytes,
+        }
+
+        if self.phase_history is not None:
+            report["edge_delays"] = self._edge_delays.nbytes
+            report["coupled_rows"] = self._coupled_nodes.nbytes + self._coupled_starts.nbytes
+            report["phase_history"] = self.phase_history.buffer.nbytes
+
+        report["total"] = sum(report.values())
+        return report
+
     def analyze_harmonic_spectrum(self) -> Dict[str, float]:
         """Perform FFT analysis on expansion history"""
         if len(self.expansion_history) < 10: